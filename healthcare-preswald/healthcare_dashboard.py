@@ -1,33 +1,153 @@
+import math
+import os
+import sys
+import tempfile
+import types
+from functools import wraps
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import polars as pl
 import preswald
 
-# Load dataset and clean columns
-df = pd.read_csv("data/healthcare_dataset.csv")
-df.columns = df.columns.str.strip().str.upper()
+CSV_PATH = "data/healthcare_dataset.csv"
+# Bump whenever load_df changes what it writes, so stale caches are regenerated
+CACHE_VERSION = 3
+PARQUET_PATH = f"data/healthcare_dataset.v{CACHE_VERSION}.parquet"
+
+USECOLS = [
+    "Age", "Gender", "Medical Condition", "Billing Amount", "Date of Admission",
+    "Discharge Date", "Admission Type", "Blood Type", "Name", "Hospital"
+]
+DTYPES = {
+    # Nullable so a blank age reaches the dropna below instead of failing the read
+    "Age": "Int16",
+    # float64 keeps amounts identical to the source for the table and sums
+    "Billing Amount": "float64",
+    "Gender": "category",
+    "Medical Condition": "category",
+    "Admission Type": "category",
+    "Blood Type": "category"
+}
+
+# Cap on scatter points drawn per month in the billing vs age explorer
+MAX_POINTS_PER_FRAME = 2000
+
+# Dataset version token; the cached figure builders below are keyed on it
+VER = os.stat(CSV_PATH).st_mtime_ns
+
+# preswald re-executes this script in a fresh namespace on every rerun, so the
+# figure cache lives on a module object that survives in sys.modules
+_cache_module = sys.modules.setdefault(
+    "_healthcare_dashboard_cache", types.ModuleType("_healthcare_dashboard_cache")
+)
+_FIGURE_CACHE = vars(_cache_module).setdefault("figures", {})
+
+
+def _code_identity(builder):
+    """Fingerprint a builder's code so source edits invalidate its cache entry."""
+    code = builder.__code__
+    script_mtime = (
+        os.stat(code.co_filename).st_mtime_ns if os.path.isfile(code.co_filename) else None
+    )
+    return hash((code.co_code, code.co_consts, code.co_names)), script_mtime
+
+
+def cached_figure(builder):
+    """Memoize ``builder(ver)`` in the cache shared across preswald reruns."""
+    identity = _code_identity(builder)
+
+    @wraps(builder)
+    def wrapper(ver):
+        key = (ver, identity)
+        entry = _FIGURE_CACHE.get(builder.__name__)
+        if entry is None or entry[0] != key:
+            # One entry per builder, so stale figures are replaced, not kept
+            entry = _FIGURE_CACHE[builder.__name__] = (key, builder(ver))
+        return entry[1]
+    return wrapper
+
+
+def load_df(csv_path=CSV_PATH, parquet_path=PARQUET_PATH):
+    """Load the dataset, reusing the Parquet cache unless the CSV is newer."""
+    csv_mtime = os.path.getmtime(csv_path)
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= csv_mtime:
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+
+    # Load only the columns the dashboard uses with the multithreaded Arrow parser
+    df = pd.read_csv(csv_path, engine="pyarrow", usecols=USECOLS, dtype=DTYPES)
+    df.columns = df.columns.str.strip().str.upper()
+
+    # Arrow already types clean ISO date columns; coercing here turns any
+    # malformed value into NaT so the row is dropped rather than failing the load
+    for col in ("DATE OF ADMISSION", "DISCHARGE DATE"):
+        df[col] = pd.to_datetime(df[col], format="%Y-%m-%d", errors="coerce", cache=True)
+
+    # Length of stay as a plain day-resolution subtraction on the NumPy views;
+    # missing dates come out as NaN and are dropped with the other gaps below
+    admitted = df["DATE OF ADMISSION"].to_numpy("datetime64[D]")
+    discharged = df["DISCHARGE DATE"].to_numpy("datetime64[D]")
+    df["LENGTH OF STAY"] = (discharged - admitted) / np.timedelta64(1, "D")
+
+    # Cache the parsed frame (including LENGTH OF STAY) for the next load
+    write_parquet_cache(df, parquet_path)
+    return df
+
+
+def write_parquet_cache(df, parquet_path):
+    """Atomically write the Parquet cache; a cache that can't be written is skipped."""
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(parquet_path) or ".", prefix=".tmp-", suffix=".parquet"
+        )
+        os.close(fd)
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        # Readers only ever see the old file or the complete new one
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        # Read-only deployments still serve the freshly parsed frame
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
-# Parse date columns for length of stay
-df["DATE OF ADMISSION"] = pd.to_datetime(df["DATE OF ADMISSION"], errors="coerce")
-df["DISCHARGE DATE"] = pd.to_datetime(df["DISCHARGE DATE"], errors="coerce")
-df["LENGTH OF STAY"] = (df["DISCHARGE DATE"] - df["DATE OF ADMISSION"]).dt.days
+
+df = load_df()
 
 # Clean rows with critical missing values for analysis
-df_clean = df.dropna(subset=["AGE", "GENDER", "MEDICAL CONDITION", "BILLING AMOUNT", "DATE OF ADMISSION"])
+df_clean = df.dropna(
+    subset=["AGE", "GENDER", "MEDICAL CONDITION", "BILLING AMOUNT", "DATE OF ADMISSION", "LENGTH OF STAY"]
+).copy()
 
-# Page header
-preswald.text("# 🏥 Healthcare Data Dashboard")
-preswald.text(f"Total Patient Records: **{len(df_clean)}**")
+# Downcast numerics and store low-cardinality strings as categoricals; drop
+# categories whose only rows were removed above so they don't chart as zeros
+for col in ("GENDER", "BLOOD TYPE", "MEDICAL CONDITION", "ADMISSION TYPE"):
+    df_clean[col] = df_clean[col].astype("category").cat.remove_unused_categories()
+df_clean["AGE"] = df_clean["AGE"].astype("int16")
+df_clean["LENGTH OF STAY"] = df_clean["LENGTH OF STAY"].astype("int16")
 
-# -------------------- Gender Split --------------------
-preswald.text("## 👤 Gender Distribution")
-preswald.text("""
-This bar chart displays the distribution of patients by gender. It helps identify any imbalance in the gender representation among patients and may reveal trends in healthcare access or conditions that are more prevalent in one gender.
-""")
+# Month bucket for the month-by-month scatter
+df_clean["ADMISSION MONTH"] = df_clean["DATE OF ADMISSION"].values.astype("datetime64[M]").astype("datetime64[ns]")
+
+# -------------------- Cached Figure Builders --------------------
+numerical_cols = ["AGE", "BILLING AMOUNT", "LENGTH OF STAY"]
 
-if "GENDER" in df_clean.columns:
-    gender_counts = df_clean["GENDER"].value_counts().reset_index()
-    gender_counts.columns = ["Gender", "Count"]
+
+def integer_bin_edges(values, nbins):
+    """Equal-width integer bin edges covering ``values`` in about ``nbins`` bins.
+
+    Fractional edges over integer data give some bins one value fewer than
+    their neighbours, which shows up as false dips.
+    """
+    lo, hi = int(values.min()), int(values.max())
+    width = math.ceil((hi - lo + 1) / nbins)
+    return np.arange(lo, hi + width + 1, width), width
+
+
+@cached_figure
+def gender_fig(ver):
+    gender_counts = df_clean["GENDER"].value_counts().rename_axis("Gender").reset_index(name="Count")
 
     fig_gender_bar = px.bar(
         gender_counts,
@@ -54,67 +174,68 @@ if "GENDER" in df_clean.columns:
         plot_bgcolor='rgba(0,0,0,0)',
         autosize=True
     )
-    preswald.plotly(fig_gender_bar)
-
-# -------------------- Age Distribution --------------------
-preswald.text("## 🎂 Age Distribution")
-preswald.text("""
-This histogram shows how patients are distributed by age. Recognizing age group trends allows hospitals to tailor care—such as pediatrics for younger ages or geriatric services for older populations.
-""")
-
-if "AGE" in df_clean.columns:
-    fig_age = px.histogram(
-        df_clean,
-        x="AGE",
-        nbins=20,
-        title="🎂 Age Distribution",
-        color_discrete_sequence=["#118AB2"]
-    )
+    return fig_gender_bar
+
+
+@cached_figure
+def age_fig(ver):
+    # Bin server-side so only 20 counts are sent instead of every AGE value
+    ages = df_clean["AGE"].to_numpy(np.int16)
+    edges, width = integer_bin_edges(ages, 20)
+    counts, _ = np.histogram(ages, bins=edges)
+    fig_age = go.Figure(go.Bar(
+        x=edges[:-1] + width / 2,
+        y=counts,
+        width=width,
+        marker_color="#118AB2",
+        marker_line_color="white",
+        marker_line_width=1
+    ))
     fig_age.update_layout(
-        bargap=0.1,
+        title="🎂 Age Distribution",
+        xaxis_title="AGE",
+        yaxis_title="count",
         autosize=True,
         margin=dict(l=40, r=40, t=60, b=40)
     )
-    preswald.plotly(fig_age)
+    return fig_age
 
-# -------------------- Top 10 Medical Conditions --------------------
-preswald.text("## 🩺 Top Medical Conditions")
-preswald.text("""
-This bar chart highlights the top 10 most commonly diagnosed medical conditions in the dataset. It helps clinicians and hospital admins focus on high-frequency issues and better allocate staff and resources.
-""")
 
-if "MEDICAL CONDITION" in df_clean.columns:
-    cond_counts = df_clean["MEDICAL CONDITION"].value_counts().nlargest(10).reset_index()
-    cond_counts.columns = ["Medical Condition", "Count"]
+@cached_figure
+def cond_fig(ver):
+    cond_counts = (
+        df_clean["MEDICAL CONDITION"].value_counts().nlargest(10)
+        .rename_axis("Medical Condition").reset_index(name="Count")
+    )
     fig_cond = px.bar(cond_counts, x="Medical Condition", y="Count", color="Count",
                       color_continuous_scale="Turbo", title="Top 10 Medical Conditions")
-    preswald.plotly(fig_cond)
+    return fig_cond
 
-# -------------------- Billing by Admission Type --------------------
-preswald.text("## 💰 Billing by Admission Type")
-preswald.text("""
-This box plot displays the variation in billing amounts across different admission types. It helps assess how costs differ between emergency, elective, and other types of hospital admissions.
-""")
 
-if "BILLING AMOUNT" in df_clean.columns and "ADMISSION TYPE" in df_clean.columns:
+@cached_figure
+def billing_box_fig(ver):
     fig_billing = px.box(df_clean, x="ADMISSION TYPE", y="BILLING AMOUNT", color="ADMISSION TYPE",
                          title="Billing Amount by Admission Type",
                          color_discrete_sequence=px.colors.qualitative.Set2)
-    preswald.plotly(fig_billing)
-
-# -------------------- Heatmap: Age vs Length of Stay --------------------
-preswald.text("## 🔥 Age vs Length of Stay")
-preswald.text("""
-This heatmap shows how patient age correlates with the length of hospital stay. Hotter regions indicate where many patients cluster. It can reveal whether certain age groups tend to stay longer.
-""")
-
-if "AGE" in df_clean.columns and "LENGTH OF STAY" in df_clean.columns:
-    fig_los_heat = px.density_heatmap(
-        df_clean,
-        x="AGE",
-        y="LENGTH OF STAY",
-        nbinsx=20,
-        nbinsy=15,
+    return fig_billing
+
+
+@cached_figure
+def los_heat_fig(ver):
+    # Bin server-side so only the ~20x15 count matrix is sent to the browser
+    ages = df_clean["AGE"].to_numpy()
+    stays = df_clean["LENGTH OF STAY"].to_numpy()
+    age_edges, _ = integer_bin_edges(ages, 20)
+    los_edges, _ = integer_bin_edges(stays, 15)
+    counts, _, _ = np.histogram2d(ages, stays, bins=[age_edges, los_edges])
+    # px.imshow places x/y labels at cell centres
+    fig_los_heat = px.imshow(
+        counts.T,
+        x=(age_edges[:-1] + age_edges[1:]) / 2,
+        y=(los_edges[:-1] + los_edges[1:]) / 2,
+        origin="lower",
+        aspect="auto",
+        labels=dict(color="count"),
         title="🔥 Patient Age vs Length of Stay",
         color_continuous_scale="Viridis"
     )
@@ -126,19 +247,14 @@ if "AGE" in df_clean.columns and "LENGTH OF STAY" in df_clean.columns:
         height=450
     )
 
-    preswald.plotly(fig_los_heat)
+    return fig_los_heat
 
-# -------------------- Blood Type by Gender --------------------
-preswald.text("## 🩸 Blood Type Distribution by Gender")
-preswald.text("""
-This stacked bar chart illustrates how different blood types are distributed across genders. It helps with inventory planning in blood banks and understanding genetic distributions.
-""")
 
-if "BLOOD TYPE" in df_clean.columns and "GENDER" in df_clean.columns:
-    blood_gender = df_clean.groupby(["BLOOD TYPE", "GENDER"]).size().reset_index(name="Count")
-    sorted_bloods = blood_gender.groupby("BLOOD TYPE")["Count"].sum().sort_values(ascending=False).index
-    blood_gender["BLOOD TYPE"] = pd.Categorical(blood_gender["BLOOD TYPE"], categories=sorted_bloods, ordered=True)
-    blood_gender = blood_gender.sort_values("BLOOD TYPE")
+@cached_figure
+def blood_gender_fig(ver):
+    blood_gender = df_clean.groupby(["BLOOD TYPE", "GENDER"], observed=True).size().reset_index(name="Count")
+    # Ordering is derived from the already-reduced frame; category_orders applies it
+    sorted_bloods = blood_gender.groupby("BLOOD TYPE", observed=True)["Count"].sum().sort_values(ascending=False).index
 
     fig_blood_gender = px.bar(
         blood_gender,
@@ -163,57 +279,45 @@ if "BLOOD TYPE" in df_clean.columns and "GENDER" in df_clean.columns:
         margin=dict(l=40, r=30, t=60, b=40)
     )
 
-    preswald.plotly(fig_blood_gender)
+    return fig_blood_gender
 
-# -------------------- Billing Trend Over Time --------------------
-preswald.text("## 📈 Billing Over Time")
-preswald.text("""
-This line chart tracks total billing amounts over time (monthly). It reveals seasonal trends, spikes, or dips in hospital revenue or service usage that can help in operational forecasting.
-""")
 
-if "DATE OF ADMISSION" in df_clean.columns and "BILLING AMOUNT" in df_clean.columns:
-    df_clean["MONTH"] = df_clean["DATE OF ADMISSION"].dt.to_period("M").dt.to_timestamp()
-    billing_monthly = df_clean.groupby("MONTH")["BILLING AMOUNT"].sum().reset_index()
+@cached_figure
+def billing_time_fig(ver):
+    # Sorting once lets polars take its sorted-key path for the monthly windows
+    billing_monthly = (
+        pl.from_pandas(df_clean[["DATE OF ADMISSION", "BILLING AMOUNT"]])
+        .sort("DATE OF ADMISSION")
+        .group_by_dynamic("DATE OF ADMISSION", every="1mo")
+        .agg(pl.col("BILLING AMOUNT").sum())
+        .rename({"DATE OF ADMISSION": "MONTH"})
+        .to_pandas()
+    )
     fig_billing_time = px.line(billing_monthly, x="MONTH", y="BILLING AMOUNT",
                                title="Total Billing Amount Over Time", markers=True,
                                color_discrete_sequence=["#EF476F"])
-    preswald.plotly(fig_billing_time)
-
-# -------------------- Correlation Heatmap --------------------
-preswald.text("## 📊 Correlation Heatmap")
-preswald.text("""
-This heatmap shows correlations among numerical fields like age, billing amount, and length of stay. Strong correlations (positive or negative) help in building predictive models or identifying underlying patterns.
-""")
-
-numerical_cols = ["AGE", "BILLING AMOUNT", "LENGTH OF STAY"]
-if all(col in df_clean.columns for col in numerical_cols):
-    corr = df_clean[numerical_cols].corr()
-    fig_corr = px.imshow(corr, text_auto=True, color_continuous_scale='RdBu_r', title="Correlation Heatmap")
-    preswald.plotly(fig_corr)
-
-# -------------------- Top 5 Highest Billing Patients --------------------
-preswald.text("## 💸 Top 5 Highest Billing Patients")
-preswald.text("""
-This table showcases the five patients with the highest billing amounts. Useful for reviewing high-cost cases and understanding what conditions or admission types drive healthcare expenses.
-""")
+    return fig_billing_time
 
-top_billed = df_clean.sort_values("BILLING AMOUNT", ascending=False).head(5)
-preswald.table(top_billed[["NAME", "BILLING AMOUNT", "MEDICAL CONDITION", "HOSPITAL", "ADMISSION TYPE"]])
 
-# -------------------- Animated Billing vs Age (by Month) --------------------
-preswald.text("## 🌀 Explore Billing vs Age (Month-by-Month)")
-preswald.text("""
-This animated scatter plot allows exploration of how billing and age correlate over different months. Each point's size represents length of stay, offering a dynamic view of patient characteristics over time.
-""")
+@cached_figure
+def corr_fig(ver):
+    arr = np.ascontiguousarray(df_clean[numerical_cols].to_numpy(dtype=np.float32))
+    corr = np.corrcoef(arr, rowvar=False)
+    fig_corr = px.imshow(corr, x=numerical_cols, y=numerical_cols, text_auto=".2f",
+                         color_continuous_scale='RdBu_r', zmin=-1, zmax=1, title="Correlation Heatmap")
+    return fig_corr
 
-if "DATE OF ADMISSION" in df_clean.columns:
-    df_clean["ADMISSION MONTH"] = df_clean["DATE OF ADMISSION"].dt.to_period("M").dt.to_timestamp()
 
-    months = df_clean["ADMISSION MONTH"].dropna().sort_values().unique()
+@cached_figure
+def billing_age_fig(ver):
+    months = []
     frames = []
 
-    for month in months:
-        month_data = df_clean[df_clean["ADMISSION MONTH"] == month]
+    # One hash-grouped pass over the frame instead of a boolean mask per month
+    for month, month_data in df_clean.groupby("ADMISSION MONTH", sort=True, observed=True):
+        months.append(month)
+        if len(month_data) > MAX_POINTS_PER_FRAME:
+            month_data = month_data.sample(MAX_POINTS_PER_FRAME, random_state=0)
         trace = go.Scatter(
             x=month_data["AGE"],
             y=month_data["BILLING AMOUNT"],
@@ -230,11 +334,14 @@ if "DATE OF ADMISSION" in df_clean.columns:
 
     fig_manual = go.Figure(data=frames)
 
+    # Row j of the identity matrix shows only month j's trace
+    masks = np.eye(len(months), dtype=bool).tolist()
+
     fig_manual.update_layout(
         updatemenus=[
             {
                 "buttons": [
-                    {"label": str(month), "method": "update", "args": [{"visible": [i == j for i in range(len(months))]}]}
+                    {"label": str(month), "method": "update", "args": [{"visible": masks[j]}]}
                     for j, month in enumerate(months)
                 ],
                 "direction": "down",
@@ -250,27 +357,141 @@ if "DATE OF ADMISSION" in df_clean.columns:
         yaxis_title="Billing Amount"
     )
 
-    preswald.plotly(fig_manual)
-    
-    
-# -------------------- Sunburst: Admission Type → Medical Condition → Gender --------------------
-preswald.text("## 🌈 Hierarchical Breakdown: Admission → Condition → Gender")
-preswald.text("""
+    return fig_manual
+
+
+@cached_figure
+def sunburst_fig(ver):
+    # Pre-aggregate leaf counts so plotly does not count rows itself
+    sunburst_counts = (
+        df_clean.groupby(["ADMISSION TYPE", "MEDICAL CONDITION", "GENDER"], observed=True)
+        .size()
+        .reset_index(name="count")
+    )
+    fig_sunburst = px.sunburst(
+        sunburst_counts,
+        path=["ADMISSION TYPE", "MEDICAL CONDITION", "GENDER"],
+        values="count",
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    return fig_sunburst
+
+
+def main():
+    # Page header
+    preswald.text("# 🏥 Healthcare Data Dashboard")
+    preswald.text(f"Total Patient Records: **{len(df_clean)}**")
+
+    # -------------------- Gender Split --------------------
+    preswald.text("## 👤 Gender Distribution")
+    preswald.text("""
+This bar chart displays the distribution of patients by gender. It helps identify any imbalance in the gender representation among patients and may reveal trends in healthcare access or conditions that are more prevalent in one gender.
+""")
+
+    if "GENDER" in df_clean.columns:
+        preswald.plotly(gender_fig(VER))
+
+    # -------------------- Age Distribution --------------------
+    preswald.text("## 🎂 Age Distribution")
+    preswald.text("""
+This histogram shows how patients are distributed by age. Recognizing age group trends allows hospitals to tailor care—such as pediatrics for younger ages or geriatric services for older populations.
+""")
+
+    if "AGE" in df_clean.columns:
+        preswald.plotly(age_fig(VER))
+
+    # -------------------- Top 10 Medical Conditions --------------------
+    preswald.text("## 🩺 Top Medical Conditions")
+    preswald.text("""
+This bar chart highlights the top 10 most commonly diagnosed medical conditions in the dataset. It helps clinicians and hospital admins focus on high-frequency issues and better allocate staff and resources.
+""")
+
+    if "MEDICAL CONDITION" in df_clean.columns:
+        preswald.plotly(cond_fig(VER))
+
+    # -------------------- Billing by Admission Type --------------------
+    preswald.text("## 💰 Billing by Admission Type")
+    preswald.text("""
+This box plot displays the variation in billing amounts across different admission types. It helps assess how costs differ between emergency, elective, and other types of hospital admissions.
+""")
+
+    if "BILLING AMOUNT" in df_clean.columns and "ADMISSION TYPE" in df_clean.columns:
+        preswald.plotly(billing_box_fig(VER))
+
+    # -------------------- Heatmap: Age vs Length of Stay --------------------
+    preswald.text("## 🔥 Age vs Length of Stay")
+    preswald.text("""
+This heatmap shows how patient age correlates with the length of hospital stay. Hotter regions indicate where many patients cluster. It can reveal whether certain age groups tend to stay longer.
+""")
+
+    if "AGE" in df_clean.columns and "LENGTH OF STAY" in df_clean.columns:
+        preswald.plotly(los_heat_fig(VER))
+
+    # -------------------- Blood Type by Gender --------------------
+    preswald.text("## 🩸 Blood Type Distribution by Gender")
+    preswald.text("""
+This stacked bar chart illustrates how different blood types are distributed across genders. It helps with inventory planning in blood banks and understanding genetic distributions.
+""")
+
+    if "BLOOD TYPE" in df_clean.columns and "GENDER" in df_clean.columns:
+        preswald.plotly(blood_gender_fig(VER))
+
+    # -------------------- Billing Trend Over Time --------------------
+    preswald.text("## 📈 Billing Over Time")
+    preswald.text("""
+This line chart tracks total billing amounts over time (monthly). It reveals seasonal trends, spikes, or dips in hospital revenue or service usage that can help in operational forecasting.
+""")
+
+    if "DATE OF ADMISSION" in df_clean.columns and "BILLING AMOUNT" in df_clean.columns:
+        preswald.plotly(billing_time_fig(VER))
+
+    # -------------------- Correlation Heatmap --------------------
+    preswald.text("## 📊 Correlation Heatmap")
+    preswald.text("""
+This heatmap shows correlations among numerical fields like age, billing amount, and length of stay. Strong correlations (positive or negative) help in building predictive models or identifying underlying patterns.
+""")
+
+    if all(col in df_clean.columns for col in numerical_cols):
+        preswald.plotly(corr_fig(VER))
+
+    # -------------------- Top 5 Highest Billing Patients --------------------
+    preswald.text("## 💸 Top 5 Highest Billing Patients")
+    preswald.text("""
+This table showcases the five patients with the highest billing amounts. Useful for reviewing high-cost cases and understanding what conditions or admission types drive healthcare expenses.
+""")
+
+    top_billed = df_clean.nlargest(5, "BILLING AMOUNT", keep="first")[
+        ["NAME", "BILLING AMOUNT", "MEDICAL CONDITION", "HOSPITAL", "ADMISSION TYPE"]
+    ]
+    preswald.table(top_billed)
+
+    # -------------------- Animated Billing vs Age (by Month) --------------------
+    preswald.text("## 🌀 Explore Billing vs Age (Month-by-Month)")
+    preswald.text("""
+This animated scatter plot allows exploration of how billing and age correlate over different months. Each point's size represents length of stay, offering a dynamic view of patient characteristics over time.
+""")
+
+    if "DATE OF ADMISSION" in df_clean.columns:
+        preswald.plotly(billing_age_fig(VER))
+
+    # -------------------- Sunburst: Admission Type → Medical Condition → Gender --------------------
+    preswald.text("## 🌈 Hierarchical Breakdown: Admission → Condition → Gender")
+    preswald.text("""
 This sunburst chart offers a multi-level hierarchical view of patient data. The inner circle represents admission types (e.g., Emergency, Routine),
 the next layer breaks it down by medical condition, and the outermost layer shows gender distribution.
 This helps quickly visualize which conditions dominate each admission type and how they vary across genders,
 revealing hidden patterns in the dataset.
 """)
 
-if all(col in df_clean.columns for col in ["ADMISSION TYPE", "MEDICAL CONDITION", "GENDER"]):
-    fig_sunburst = px.sunburst(
-        df_clean,
-        path=["ADMISSION TYPE", "MEDICAL CONDITION", "GENDER"],
-        color_discrete_sequence=px.colors.qualitative.Bold
-    )
-    preswald.plotly(fig_sunburst)
+    if all(col in df_clean.columns for col in ["ADMISSION TYPE", "MEDICAL CONDITION", "GENDER"]):
+        preswald.plotly(sunburst_fig(VER))
+
+    preswald.text("---")
+    preswald.text("📘 Dashboard created and visualized by **Samarth Sharma** using Preswald.")
 
 
-preswald.text("---")
-preswald.text("📘 Dashboard created and visualized by **Samarth Sharma** using Preswald.")
-  
+# preswald execs this file in a namespace without __name__, which then resolves
+# to builtins.__name__ ("builtins"); a plain import still renders nothing. The
+# data load above runs again on every rerun; only the figure cache persists.
+if __name__ in ("__main__", "builtins"):
+    main()